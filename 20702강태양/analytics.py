@@ -0,0 +1,183 @@
+"""모터스포츠 경기 결과 통계 (우승 횟수, 연승 기록, 팀 대결)
+
+모든 시리즈의 `results`를 하나의 DataFrame으로 모아 집계 결과를 미리 계산해 둡니다.
+집계는 데이터 버전(JSON 내용의 해시)마다 한 번만 만들고, 기존 결과에 새 결과가
+추가된 경우에는 새로 들어온 행만 반영해서 갱신합니다.
+"""
+import threading
+
+import pandas as pd
+
+from motorsports_data import data_version
+
+RESULT_COLUMNS = ["series_id", "series_name", "season", "date", "event", "winner", "team", "points"]
+RESULT_KEY = ["series_id", "date", "event"]
+
+# 데이터 버전별로 만들어 둔 집계 (Streamlit 세션들이 함께 사용)
+_cache = {"version": None, "aggregates": None}
+_lock = threading.Lock()
+
+
+def results_frame(data):
+    """모든 시리즈의 경기 결과를 하나의 DataFrame으로 변환"""
+    rows = []
+    for ms in data.get("motorsports", []):
+        if not isinstance(ms, dict):
+            continue
+        # 드라이버 챔피언십 정보로 우승자의 팀 찾기
+        teams = {
+            driver.get("driver"): driver.get("team")
+            for driver in ms.get("driver_championship", []) or []
+            if isinstance(driver, dict)
+        }
+        for result in ms.get("results", []) or []:
+            if not isinstance(result, dict) or not result.get("winner"):
+                continue
+            rows.append({
+                "series_id": ms.get("id", ""),
+                "series_name": ms.get("name", "이름 없음"),
+                "date": result.get("date", ""),
+                "event": result.get("event", "정보 없음"),
+                "winner": result["winner"],
+                "team": teams.get(result["winner"]) or "정보 없음",
+                "points": result.get("points") or 0,
+            })
+
+    df = pd.DataFrame(rows, columns=[c for c in RESULT_COLUMNS if c != "season"])
+    df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%d", errors="coerce")
+    df = df.dropna(subset=["date"])
+    df["season"] = df["date"].dt.year.astype("int64")
+    df["points"] = pd.to_numeric(df["points"], errors="coerce").fillna(0)
+    return df[RESULT_COLUMNS].drop_duplicates(subset=RESULT_KEY).reset_index(drop=True)
+
+
+def _count_wins(results, by):
+    """by 기준으로 우승 횟수와 획득 포인트 합계 구하기"""
+    return results.groupby(by).agg(wins=("event", "size"), points=("points", "sum"))
+
+
+def _add_counts(counts, new_counts):
+    """집계된 우승 횟수에 새 우승 횟수 더하기"""
+    total = counts.add(new_counts, fill_value=0)
+    # add는 빈 칸을 채우면서 정수를 실수로 바꾸므로 원래 자료형으로 되돌림
+    points_dtype = new_counts["points"].dtype if counts.empty else counts["points"].dtype
+    return total.astype({"wins": "int64", "points": points_dtype}).sort_index()
+
+
+def _driver_ranking(counts):
+    """모든 시즌을 합친 시리즈별 드라이버 우승 순위 (우승 횟수 내림차순)"""
+    ranking = counts.sort_index().sort_values("wins", ascending=False, kind="stable")
+    return ranking.astype({"wins": "int64"})
+
+
+def _team_head_to_head(wins_by_team):
+    """시리즈/시즌별 팀 우승 횟수를 팀을 열로 하는 표로 변환"""
+    return wins_by_team["wins"].unstack("team", fill_value=0)
+
+
+def _streaks(results):
+    """시리즈별로 같은 드라이버가 연속으로 우승한 기록 구하기"""
+    if results.empty:
+        return pd.DataFrame(columns=["series_id", "winner", "streak", "start", "end"])
+
+    ordered = results.sort_values(["series_id", "date"])
+    # 시리즈가 바뀌거나 우승자가 바뀌면 새로운 연승 구간 시작
+    new_run = (ordered["series_id"] != ordered["series_id"].shift()) | (
+        ordered["winner"] != ordered["winner"].shift()
+    )
+    runs = ordered.groupby(new_run.cumsum()).agg(
+        series_id=("series_id", "first"),
+        winner=("winner", "first"),
+        streak=("event", "size"),
+        start=("date", "first"),
+        end=("date", "last"),
+    )
+    return runs.sort_values(["series_id", "streak", "end"], ascending=[True, False, False]).reset_index(drop=True)
+
+
+def build_aggregates(results):
+    """경기 결과 DataFrame으로 전체 집계 만들기"""
+    wins_by_team = _count_wins(results, ["series_id", "season", "team"])
+    return {
+        "results": results,
+        "wins_by_driver": _count_wins(results, ["series_id", "season", "winner"]),
+        "wins_by_driver_all": _driver_ranking(_count_wins(results, ["series_id", "winner"])),
+        "wins_by_team": wins_by_team,
+        "team_head_to_head": _team_head_to_head(wins_by_team),
+        "streaks": _streaks(results),
+    }
+
+
+def merge_results(aggregates, new_results):
+    """기존 집계에 새 경기 결과를 반영 (새로 추가된 행만 다시 계산)"""
+    old_results = aggregates["results"]
+    if old_results.empty:
+        # 빈 DataFrame과 합치면 열 자료형이 달라지므로 새 결과로 바로 만듦
+        return build_aggregates(new_results.drop_duplicates(subset=RESULT_KEY).reset_index(drop=True))
+    merged = pd.concat([old_results, new_results], ignore_index=True)
+    added = merged.drop_duplicates(subset=RESULT_KEY).iloc[len(old_results):]
+    if added.empty:
+        return aggregates
+
+    results = pd.concat([old_results, added], ignore_index=True)
+    wins_by_team = _add_counts(aggregates["wins_by_team"], _count_wins(added, ["series_id", "season", "team"]))
+    wins_by_driver = _add_counts(aggregates["wins_by_driver"], _count_wins(added, ["series_id", "season", "winner"]))
+    wins_by_driver_all = _driver_ranking(
+        _add_counts(aggregates["wins_by_driver_all"], _count_wins(added, ["series_id", "winner"]))
+    )
+
+    # 연승 기록은 새 결과가 들어온 시리즈만 다시 계산
+    changed = added["series_id"].unique()
+    streaks = aggregates["streaks"]
+    streaks = pd.concat(
+        [
+            streaks[~streaks["series_id"].isin(changed)],
+            _streaks(results[results["series_id"].isin(changed)]),
+        ],
+        ignore_index=True,
+    )
+
+    return {
+        "results": results,
+        "wins_by_driver": wins_by_driver,
+        "wins_by_driver_all": wins_by_driver_all,
+        "wins_by_team": wins_by_team,
+        "team_head_to_head": _team_head_to_head(wins_by_team),
+        "streaks": streaks.sort_values(
+            ["series_id", "streak", "end"], ascending=[True, False, False]
+        ).reset_index(drop=True),
+    }
+
+
+def get_aggregates(data):
+    """데이터 버전에 맞는 집계 가져오기
+
+    같은 버전이면 저장된 집계를 그대로 돌려주고, 기존 결과가 모두 남아 있고
+    새 결과만 추가된 경우에는 merge_results로 갱신합니다. 그 외에는 새로 만듭니다.
+    """
+    version = data_version(data)
+    with _lock:
+        if _cache["version"] == version:
+            return _cache["aggregates"]
+
+        results = results_frame(data)
+        previous = _cache["aggregates"]
+        if previous is not None and _is_append_only(previous["results"], results):
+            aggregates = merge_results(previous, results)
+        else:
+            aggregates = build_aggregates(results)
+
+        _cache["version"] = version
+        _cache["aggregates"] = aggregates
+        return aggregates
+
+
+def _is_append_only(old_results, new_results):
+    """기존 결과가 바뀌지 않고 그대로 남아 있는지 확인"""
+    merged = old_results.merge(new_results, how="left", on=RESULT_KEY, suffixes=("", "_new"), indicator=True)
+    if (merged["_merge"] != "both").any():
+        return False
+    # 우승자나 포인트가 수정된 경우에는 전체를 다시 계산
+    return (merged["winner"] == merged["winner_new"]).all() and (merged["points"] == merged["points_new"]).all() and (
+        merged["team"] == merged["team_new"]
+    ).all()
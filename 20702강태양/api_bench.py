@@ -0,0 +1,111 @@
+"""API 서버 부하 테스트 도구
+
+keep-alive 연결 여러 개로 API 서버에 동시에 요청을 보내고 처리량과 지연 시간을 측정합니다.
+
+사용 예시:
+    python api_server.py &
+    python api_bench.py --connections 64 --duration 10
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+DEFAULT_PATHS = [
+    "/series",
+    "/series/f1/schedule",
+    "/series/moto_gp/results",
+    "/series/nascar/standings",
+]
+
+
+async def _client(host, port, paths, deadline, latencies, statuses, gzip, etags):
+    """연결 하나를 열어 마감 시간까지 요청을 반복"""
+    reader, writer = await asyncio.open_connection(host, port)
+    i = 0
+    try:
+        while time.perf_counter() < deadline:
+            path = paths[i % len(paths)]
+            i += 1
+            headers = [f"GET {path} HTTP/1.1", f"Host: {host}:{port}"]
+            if gzip:
+                headers.append("Accept-Encoding: gzip")
+            if etags is not None and path in etags:
+                headers.append(f"If-None-Match: {etags[path]}")
+
+            started = time.perf_counter()
+            writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1"))
+            head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+            response_headers = {}
+            for line in head[1:]:
+                if ":" in line:
+                    name, value = line.split(":", 1)
+                    response_headers[name.strip().lower()] = value.strip()
+            length = int(response_headers.get("content-length", "0"))
+            if length:
+                await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+
+            statuses[int(head[0].split(" ")[1])] += 1
+            if etags is not None and "etag" in response_headers:
+                etags[path] = response_headers["etag"]
+            if response_headers.get("connection", "").lower() == "close":
+                break
+    finally:
+        writer.close()
+
+
+async def run_bench(host, port, connections, duration, paths, gzip=False, conditional=False):
+    """부하 테스트를 실행하고 결과 반환"""
+    latencies = []
+    statuses = Counter()
+    deadline = time.perf_counter() + duration
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        _client(host, port, paths, deadline, latencies, statuses, gzip, {} if conditional else None)
+        for _ in range(connections)
+    ])
+    elapsed = time.perf_counter() - started
+    return latencies, statuses, elapsed
+
+
+def _percentile(sorted_values, p):
+    """정렬된 값에서 백분위수 구하기"""
+    index = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모터스포츠 API 부하 테스트")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--connections", type=int, default=32, help="동시 연결 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="테스트 시간 (초)")
+    parser.add_argument("--paths", nargs="+", default=DEFAULT_PATHS, help="요청할 경로 목록")
+    parser.add_argument("--gzip", action="store_true", help="gzip 압축 응답 요청")
+    parser.add_argument("--conditional", action="store_true", help="받은 ETag로 If-None-Match 요청 (304 확인)")
+    args = parser.parse_args()
+
+    latencies, statuses, elapsed = asyncio.run(run_bench(
+        args.host, args.port, args.connections, args.duration, args.paths, args.gzip, args.conditional
+    ))
+    if not latencies:
+        print("완료된 요청이 없습니다.")
+        return
+
+    latencies.sort()
+    print(f"요청 수: {len(latencies):,} ({elapsed:.1f}초, 연결 {args.connections}개)")
+    print(f"처리량: {len(latencies) / elapsed:,.0f} req/s")
+    print(
+        "지연 시간(ms): "
+        f"평균 {statistics.mean(latencies) * 1000:.2f}, "
+        f"p50 {_percentile(latencies, 50) * 1000:.2f}, "
+        f"p95 {_percentile(latencies, 95) * 1000:.2f}, "
+        f"p99 {_percentile(latencies, 99) * 1000:.2f}"
+    )
+    print("상태 코드: " + ", ".join(f"{status}={count:,}" for status, count in sorted(statuses.items())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""모터스포츠 데이터 읽기 전용 JSON API 서버
+
+Streamlit 화면과 같은 `data/motorsports.json`을 다른 서비스에서 읽을 수 있도록 제공합니다.
+표준 라이브러리의 asyncio만 사용하며, 직렬화된 응답을 데이터 버전별로 메모리에 캐시합니다.
+
+엔드포인트:
+    GET /series                      시리즈 목록
+    GET /series/{id}                 시리즈 정보 (SNS 링크 포함)
+    GET /series/{id}/schedule        경기 일정
+    GET /series/{id}/results         경기 결과
+    GET /series/{id}/standings       드라이버 챔피언십 순위
+
+실행 방법:
+    python api_server.py --host 127.0.0.1 --port 8000
+"""
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import time
+from http import HTTPStatus
+from pathlib import Path
+
+from motorsports_data import DATA_FILE, data_version, read_data
+
+# 이 크기보다 작은 응답은 압축해도 이득이 거의 없으므로 그대로 보냄
+GZIP_MIN_SIZE = 1024
+MAX_HEADER_SIZE = 16 * 1024
+# 읽기 전용 API이므로 요청 본문은 사용하지 않고, 이 크기까지만 읽어서 버림
+MAX_BODY_SIZE = 64 * 1024
+KEEP_ALIVE_TIMEOUT = 15
+# 데이터 파일 변경 여부를 확인하는 최소 간격 (초)
+RELOAD_INTERVAL = 1.0
+
+
+class DataStore:
+    """데이터 파일을 읽고, 파일이 바뀌면 다시 읽어 직렬화된 응답 캐시를 비움"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.data = {"motorsports": []}
+        self.version = None
+        self._stat = None
+        self._checked_at = 0.0
+        self._series = {}
+        self._responses = {}
+
+    def refresh(self):
+        """파일이 바뀌었으면 다시 읽기 (수정 시각과 크기로 확인)"""
+        now = time.monotonic()
+        if self.version is not None and now - self._checked_at < RELOAD_INTERVAL:
+            return
+        self._checked_at = now
+        try:
+            stat = self.path.stat()
+        except OSError:
+            stat = None
+        key = (stat.st_mtime_ns, stat.st_size) if stat else None
+        if key == self._stat and self.version is not None:
+            return
+
+        data = {"motorsports": []}
+        if stat is not None:
+            try:
+                data = read_data(self.path)
+            except (OSError, ValueError):
+                # 저장 중인 파일을 읽었을 수 있으므로 이전 데이터를 유지하고 다음 요청에서 다시 시도
+                if self.version is not None:
+                    return
+
+        self.data = data
+        self.version = data_version(data)
+        self._stat = key
+        self._series = {
+            ms.get("id"): ms for ms in data["motorsports"] if isinstance(ms, dict) and ms.get("id")
+        }
+        self._responses = {}
+
+    def response(self, path):
+        """경로에 해당하는 응답 (status, body, gzip_body, etag) 가져오기"""
+        self.refresh()
+        # 빈 경로 조각을 없앤 경로를 캐시 키로 사용 (/series//f1 등이 따로 캐시되지 않도록)
+        parts = [part for part in path.split("/") if part]
+        key = "/".join(parts)
+        cached = self._responses.get(key)
+        if cached is None:
+            status, payload = self._route(parts)
+            body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            gzip_body = gzip.compress(body, compresslevel=6) if len(body) >= GZIP_MIN_SIZE else None
+            etag = '"%s"' % hashlib.sha1(self.version.encode("ascii") + body).hexdigest()[:32]
+            cached = (status, body, gzip_body, etag)
+            # 404 응답도 캐시하되, 임의의 경로로 캐시가 커지지 않도록 제한
+            if status == HTTPStatus.OK or len(self._responses) < 1024:
+                self._responses[key] = cached
+        return cached
+
+    def _route(self, parts):
+        """경로 조각을 해석해서 (status, 응답 데이터) 반환"""
+        if parts == ["series"]:
+            return HTTPStatus.OK, {
+                "version": self.version,
+                "series": [
+                    {"id": ms.get("id"), "name": ms.get("name", "이름 없음")}
+                    for ms in self._series.values()
+                ],
+            }
+
+        if len(parts) in (2, 3) and parts[0] == "series":
+            ms = self._series.get(parts[1])
+            if ms is None:
+                return HTTPStatus.NOT_FOUND, {"error": "시리즈를 찾을 수 없습니다."}
+            if len(parts) == 2:
+                return HTTPStatus.OK, {
+                    "id": ms.get("id"),
+                    "name": ms.get("name", "이름 없음"),
+                    "sns_links": ms.get("sns_links", {}),
+                }
+            fields = {"schedule": "schedule", "results": "results", "standings": "driver_championship"}
+            if parts[2] in fields:
+                return HTTPStatus.OK, {"id": ms.get("id"), parts[2]: ms.get(fields[parts[2]], [])}
+
+        return HTTPStatus.NOT_FOUND, {"error": "존재하지 않는 경로입니다."}
+
+
+def _build_response(status, headers, body=b""):
+    """HTTP 응답 바이트 만들기"""
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+    lines += [f"{name}: {value}" for name, value in headers]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+async def _read_request(reader):
+    """요청 줄과 헤더 읽기 (연결이 끊어지면 None)"""
+    try:
+        raw = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT)
+    except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+        return None
+    except asyncio.LimitOverrunError:
+        raise ValueError("헤더가 너무 큽니다.")
+
+    request_line, *header_lines = raw.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = request_line.split(" ")
+    except ValueError:
+        raise ValueError("잘못된 요청입니다.")
+    headers = {}
+    for line in header_lines:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+
+    # chunked 본문은 끝을 알려면 해석해야 하므로 받지 않음 (남은 본문을 다음 요청으로 읽지 않도록)
+    if "transfer-encoding" in headers:
+        raise ValueError("Transfer-Encoding 본문은 지원하지 않습니다.")
+
+    # 요청 본문은 사용하지 않지만, 다음 요청을 읽을 수 있도록 버림
+    length = headers.get("content-length", "0")
+    if not length.isdigit() or int(length) > MAX_BODY_SIZE:
+        raise ValueError("잘못된 Content-Length입니다.")
+    if int(length):
+        try:
+            await asyncio.wait_for(reader.readexactly(int(length)), KEEP_ALIVE_TIMEOUT)
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+            return None
+    return method, target, version, headers
+
+
+def _keep_alive(version, headers):
+    """연결을 유지할지 결정 (HTTP/1.1은 기본 유지, HTTP/1.0은 요청한 경우만)"""
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.1":
+        return connection != "close"
+    return connection == "keep-alive"
+
+
+def _accepts_gzip(headers):
+    """Accept-Encoding에 gzip이 허용되어 있는지 확인 (gzip 항목을 먼저 보고, 없으면 * 항목을 봄)"""
+    qualities = {}
+    for encoding in headers.get("accept-encoding", "").split(","):
+        name, _, params = encoding.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            param_name, _, value = param.strip().partition("=")
+            if param_name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.strip().lower()] = quality
+    if "gzip" in qualities:
+        return qualities["gzip"] > 0
+    return qualities.get("*", 0.0) > 0
+
+
+def handle_request(store, method, target, headers):
+    """요청 하나를 처리해서 (status, 헤더 목록, 본문) 반환"""
+    if method not in ("GET", "HEAD"):
+        body = json.dumps({"error": "지원하지 않는 메서드입니다."}, ensure_ascii=False).encode("utf-8")
+        return HTTPStatus.METHOD_NOT_ALLOWED, [
+            ("Allow", "GET, HEAD"),
+            ("Content-Type", "application/json; charset=utf-8"),
+            ("Content-Length", str(len(body))),
+        ], body
+
+    path = target.split("?", 1)[0].rstrip("/") or "/"
+    status, body, gzip_body, etag = store.response(path)
+    use_gzip = gzip_body is not None and _accepts_gzip(headers)
+    if use_gzip:
+        # 압축된 본문은 다른 표현이므로 ETag를 구분
+        etag = etag[:-1] + '-gzip"'
+    headers_out = [
+        ("ETag", etag),
+        ("Cache-Control", "no-cache"),
+        ("Vary", "Accept-Encoding"),
+    ]
+
+    # 클라이언트가 가진 버전과 같으면 본문 없이 304 응답
+    if_none_match = headers.get("if-none-match")
+    if status == HTTPStatus.OK and if_none_match:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        if "*" in tags or etag in tags or ("W/" + etag) in tags:
+            return HTTPStatus.NOT_MODIFIED, headers_out, b""
+
+    headers_out.append(("Content-Type", "application/json; charset=utf-8"))
+    if use_gzip:
+        body = gzip_body
+        headers_out.append(("Content-Encoding", "gzip"))
+    headers_out.append(("Content-Length", str(len(body))))
+    return status, headers_out, b"" if method == "HEAD" else body
+
+
+async def _serve_connection(store, reader, writer):
+    """연결 하나에서 요청을 계속 처리 (keep-alive)"""
+    try:
+        while True:
+            try:
+                request = await _read_request(reader)
+            except (ValueError, asyncio.IncompleteReadError):
+                writer.write(_build_response(HTTPStatus.BAD_REQUEST, [("Content-Length", "0"), ("Connection", "close")]))
+                break
+            if request is None:
+                break
+
+            method, target, version, headers = request
+            keep_alive = _keep_alive(version, headers)
+            status, headers_out, body = handle_request(store, method, target, headers)
+            if keep_alive:
+                headers_out.append(("Connection", "keep-alive"))
+                headers_out.append(("Keep-Alive", f"timeout={KEEP_ALIVE_TIMEOUT}"))
+            else:
+                headers_out.append(("Connection", "close"))
+            writer.write(_build_response(status, headers_out, body))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host, port, data_file=DATA_FILE):
+    """API 서버 실행"""
+    store = DataStore(data_file)
+    store.refresh()
+    server = await asyncio.start_server(
+        lambda reader, writer: _serve_connection(store, reader, writer),
+        host,
+        port,
+        limit=MAX_HEADER_SIZE,
+        backlog=1024,
+    )
+    addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"API 서버 실행 중: {addresses} (데이터 버전 {store.version[:12]})")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모터스포츠 데이터 JSON API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--data", default=str(DATA_FILE), help="데이터 파일 경로")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.data))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
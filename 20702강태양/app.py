@@ -5,6 +5,8 @@ import pandas as pd
 from pathlib import Path
 import requests
 import os
+import analytics
+import motorsports_data
 
 # 페이지 설정
 st.set_page_config(
@@ -52,15 +54,13 @@ def load_data():
                 st.code(debug_info)
             return {"motorsports": []}
         
-        with open(DATA_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            if not isinstance(data, dict) or "motorsports" not in data:
-                st.error("❌ 데이터 형식이 올바르지 않습니다.")
-                return {"motorsports": []}
-            return data
+        return motorsports_data.read_data(DATA_FILE)
     except json.JSONDecodeError as e:
         st.error(f"❌ JSON 파일 형식 오류: {str(e)}")
         return {"motorsports": []}
+    except ValueError:
+        st.error("❌ 데이터 형식이 올바르지 않습니다.")
+        return {"motorsports": []}
     except Exception as e:
         st.error(f"❌ 데이터를 불러오는 중 오류가 발생했습니다: {str(e)}")
         return {"motorsports": []}
@@ -327,6 +327,48 @@ def display_driver_championship(driver_championship_data):
     except Exception as e:
         st.error(f"드라이버 챔피언십 표시 중 오류가 발생했습니다: {str(e)}")
 
+def display_analytics(aggregates, series_id):
+    """미리 계산된 집계로 통계 차트 표시"""
+    results = aggregates["results"]
+    if results.empty or series_id not in set(results["series_id"]):
+        st.info("ℹ️ 통계를 만들 경기 결과가 없습니다.")
+        return
+
+    try:
+        seasons = sorted(results.loc[results["series_id"] == series_id, "season"].unique(), reverse=True)
+        season = st.selectbox("시즌을 선택하세요:", seasons, index=0, key="analytics_season")
+
+        tab1, tab2, tab3, tab4 = st.tabs(["🏆 드라이버 우승", "🔥 연승 기록", "⚔️ 팀 대결", "🌍 전체 시리즈"])
+
+        with tab1:
+            wins = aggregates["wins_by_driver"].xs((series_id, season)).sort_values("wins", ascending=False)
+            st.bar_chart(wins["wins"])
+            wins_df = wins.reset_index().rename(columns={"winner": "드라이버", "wins": "우승 횟수", "points": "우승 포인트"})
+            st.dataframe(wins_df, use_container_width=True, hide_index=True)
+
+        with tab2:
+            streaks = aggregates["streaks"]
+            streaks = streaks[streaks["series_id"] == series_id].head(10)
+            streaks_df = pd.DataFrame({
+                "드라이버": streaks["winner"],
+                "연승": streaks["streak"],
+                "시작": streaks["start"].dt.strftime("%Y-%m-%d").map(format_date),
+                "종료": streaks["end"].dt.strftime("%Y-%m-%d").map(format_date),
+            })
+            st.dataframe(streaks_df, use_container_width=True, hide_index=True)
+
+        with tab3:
+            head_to_head = aggregates["team_head_to_head"].xs((series_id, season))
+            head_to_head = head_to_head[head_to_head > 0].sort_values(ascending=False).rename("우승 횟수")
+            st.bar_chart(head_to_head)
+
+        with tab4:
+            top_drivers = aggregates["wins_by_driver_all"].head(15).reset_index()
+            top_drivers["드라이버"] = top_drivers["winner"] + " (" + top_drivers["series_id"] + ")"
+            st.bar_chart(top_drivers.set_index("드라이버")["wins"])
+    except Exception as e:
+        st.error(f"통계 표시 중 오류가 발생했습니다: {str(e)}")
+
 def main():
     # 타이틀
     st.title("🏎️ 모터스포츠 정보 센터")
@@ -420,6 +462,12 @@ def main():
     driver_championship_data = selected_motorsport.get("driver_championship", [])
     display_driver_championship(driver_championship_data)
     
+    st.markdown("---")
+    
+    # 통계 분석 섹션 (데이터 버전마다 한 번만 집계)
+    st.header("📊 통계 분석")
+    display_analytics(analytics.get_aggregates(data), selected_motorsport.get("id", ""))
+    
     # 푸터
     st.markdown("---")
     st.markdown(
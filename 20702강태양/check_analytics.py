@@ -0,0 +1,128 @@
+"""analytics.py 증분 갱신 검증 스크립트
+
+merge_results(build_aggregates(old), new)가 build_aggregates(new)와 모든 집계에서
+같은 결과를 내는지 확인합니다. analytics.py의 집계를 수정한 뒤 실행하세요.
+
+실행 방법:
+    python check_analytics.py
+"""
+import copy
+import sys
+
+import pandas.testing as pdt
+
+import analytics
+from motorsports_data import read_data
+
+
+def _series(data, series_id):
+    """id로 시리즈 찾기"""
+    return next(ms for ms in data["motorsports"] if ms.get("id") == series_id)
+
+
+def _append_to_existing(data):
+    """기존 시리즈에 결과 추가 (기존 우승자의 연승이 이어지는 경우 포함)"""
+    _series(data, "moto_gp")["results"].append(
+        {"date": "2024-11-03", "event": "Malaysian Grand Prix", "winner": "Jorge Martin", "points": 25}
+    )
+    _series(data, "wrc")["results"].append(
+        {"date": "2024-11-17", "event": "Rally Japan", "winner": "Elfyn Evans", "points": 25}
+    )
+    return data
+
+
+def _new_driver(data):
+    """새 결과에만 나오는 드라이버와 팀 (이전 집계에 없는 인덱스)"""
+    _series(data, "f1")["results"].append(
+        {"date": "2025-03-16", "event": "Australian Grand Prix", "winner": "Lando Norris", "points": 25}
+    )
+    _series(data, "f1")["results"].append(
+        {"date": "2025-03-23", "event": "Chinese Grand Prix", "winner": "Oscar Piastri", "points": 25}
+    )
+    _series(data, "indycar")["results"].append(
+        {"date": "2025-03-02", "event": "St. Petersburg Grand Prix", "winner": "Rookie Driver", "points": 50}
+    )
+    return data
+
+
+def _ranking_change(data):
+    """새 결과로 전체 시즌 우승 순위가 바뀌는 경우 (wins_by_driver_all 순서 확인)"""
+    _series(data, "nascar")["results"] += [
+        {"date": "2024-11-03", "event": "Phoenix Raceway", "winner": "Kyle Larson", "points": 40},
+        {"date": "2024-11-10", "event": "Exhibition", "winner": "Kyle Larson", "points": 40},
+        {"date": "2024-11-17", "event": "Exhibition 2", "winner": "Kyle Larson", "points": 40},
+    ]
+    return data
+
+
+def _new_series(data):
+    """이전 데이터에 없던 시리즈 추가"""
+    data["motorsports"].append({
+        "id": "super_gt",
+        "name": "SUPER GT",
+        "results": [
+            {"date": "2025-04-13", "event": "Okayama", "winner": "A", "points": 20},
+            {"date": "2025-05-04", "event": "Fuji", "winner": "A", "points": 20},
+        ],
+        "driver_championship": [{"driver": "A", "team": "Team A", "points": 40}],
+    })
+    return data
+
+
+def _clear_results(data):
+    """모든 결과를 비운 데이터 (이전 집계가 비어 있는 경우용)"""
+    for ms in data["motorsports"]:
+        ms["results"] = []
+    return data
+
+
+def check(name, old_data, new_data):
+    """증분 갱신 결과와 전체 재계산 결과 비교"""
+    old_results = analytics.results_frame(old_data)
+    new_results = analytics.results_frame(new_data)
+    assert analytics._is_append_only(old_results, new_results), f"{name}: 추가만 된 데이터가 아닙니다."
+
+    merged = analytics.merge_results(analytics.build_aggregates(old_results), new_results)
+    expected = analytics.build_aggregates(new_results)
+    assert merged.keys() == expected.keys(), f"{name}: 집계 목록이 다릅니다."
+    for key in expected:
+        if key == "results":
+            # 행 순서는 다를 수 있으므로 결과 키 기준으로 정렬해서 비교
+            pdt.assert_frame_equal(
+                merged[key].sort_values(analytics.RESULT_KEY).reset_index(drop=True),
+                expected[key].sort_values(analytics.RESULT_KEY).reset_index(drop=True),
+                obj=f"{name}: {key}",
+            )
+        else:
+            pdt.assert_frame_equal(merged[key], expected[key], obj=f"{name}: {key}")
+    print(f"통과: {name}")
+
+
+def main():
+    base = read_data()
+
+    cases = [
+        ("기존 시리즈에 결과 추가", base, _append_to_existing(copy.deepcopy(base))),
+        ("새 드라이버 추가", base, _new_driver(copy.deepcopy(base))),
+        ("전체 우승 순위 변경", base, _ranking_change(copy.deepcopy(base))),
+        ("새 시리즈 추가", base, _new_series(copy.deepcopy(base))),
+        ("빈 데이터에서 시작", _clear_results(copy.deepcopy(base)), base),
+        ("모든 경우 함께", base, _new_series(_new_driver(_append_to_existing(copy.deepcopy(base))))),
+        ("변경 없음", base, base),
+    ]
+    failed = 0
+    for name, old_data, new_data in cases:
+        try:
+            check(name, old_data, new_data)
+        except AssertionError as e:
+            failed += 1
+            print(f"실패: {e}")
+
+    if failed:
+        print(f"\n{failed}개 검사가 실패했습니다.")
+        sys.exit(1)
+    print("\n증분 갱신 결과가 전체 재계산과 같습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""모터스포츠 데이터 파일 읽기와 데이터 버전
+
+Streamlit 앱(app.py), 통계(analytics.py), API 서버(api_server.py)가 함께 사용합니다.
+API 서버가 pandas나 streamlit 없이 실행될 수 있도록 표준 라이브러리만 사용합니다.
+"""
+import hashlib
+import json
+from pathlib import Path
+
+DATA_FILE = Path(__file__).parent / "data" / "motorsports.json"
+
+
+def read_data(path=DATA_FILE):
+    """데이터 파일을 읽고 형식 확인
+
+    파일을 읽을 수 없으면 OSError, JSON 문법 오류이면 json.JSONDecodeError,
+    `motorsports` 목록이 없으면 ValueError를 발생시킵니다.
+    (json.JSONDecodeError도 ValueError이므로 먼저 처리해야 합니다.)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or not isinstance(data.get("motorsports"), list):
+        raise ValueError("데이터 형식이 올바르지 않습니다.")
+    return data
+
+
+def data_version(data):
+    """데이터 내용으로 버전 문자열 만들기"""
+    payload = json.dumps(data, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()
@@ -3,8 +3,10 @@ import streamlit as st
 # 페이지 제목 설정
 st.title("할 일 목록 (TODO List)")
 
-# 할 일 목록을 저장할 리스트
-todo_list = []
+# 할 일 목록을 저장할 리스트 (재실행해도 남아 있도록 session_state에 저장)
+if "todo_list" not in st.session_state:
+    st.session_state["todo_list"] = []
+todo_list = st.session_state["todo_list"]
 
 # 할 일 추가 함수
 def add_todo():
@@ -27,7 +29,7 @@ if todo_list:
     for i, todo in enumerate(todo_list):
         col1, col2 = st.columns([4, 1])
         col1.write(f"{i + 1}. {todo}")  # 할 일 출력
-        if col2.button("삭제", key=f"delete_{i}"):
-            delete_todo(i)  # 삭제 버튼 클릭 시 해당 할 일 삭제
+        # 삭제 버튼 클릭 시 화면을 그리기 전에 해당 할 일 삭제
+        col2.button("삭제", key=f"delete_{i}", on_click=delete_todo, args=(i,))
 else:
     st.write("할 일이 없습니다.")
\ No newline at end of file
@@ -0,0 +1,537 @@
+"""Streamlit 대시보드 동시 세션 부하 테스트 도구
+
+`streamlit run`으로 실제 Streamlit 서버를 띄우고, 브라우저 대신 웹소켓 세션 여러 개를 동시에 연결해
+사용자 동작을 보냅니다. 재실행(rerun) 지연 시간은 동작을 보낸 때부터 서버가 스크립트 실행 완료를
+알릴 때까지의 시간이고, CPU와 메모리는 서버 프로세스(PID)에서 측정합니다.
+세션당 메모리는 세션들이 연결된 동안 늘어난 서버 메모리를 세션 수로 나눈 값입니다.
+
+세션들은 이 스크립트의 한 프로세스(asyncio)에서 실행되므로 서버와 같은 컴퓨터의 CPU를 나눠 씁니다.
+세션은 생각하는 시간 없이 동작을 계속 보내므로 실제 사용자보다 부하가 큰 조건입니다.
+
+각 동작 뒤에는 화면이 실제로 바뀌었는지 확인합니다. 확인에 실패한 동작도 재실행은 되었으므로
+지연 시간에 포함하고, 확인 실패 횟수는 따로 보고합니다. 연결이 끊기거나 시간 안에 재실행이 끝나지
+않은 경우만 오류로 세며, 오류가 있는 단계는 수용 가능한 세션 수에서 제외합니다.
+
+CPU와 메모리 측정에는 /proc를 사용하므로 Linux에서만 값이 표시됩니다.
+웹소켓 연결에는 websockets 패키지가 필요합니다 (최근 Streamlit을 설치하면 함께 설치됩니다).
+
+사용 예시:
+    python load_test.py --app motorsports --sessions 1 5 10 20 --actions 20
+    python load_test.py --app todo --sessions 10 --json report.json --max-p95 300
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from collections import Counter
+from pathlib import Path
+
+import websockets
+from streamlit.proto.Alert_pb2 import Alert
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+ROOT = Path(__file__).parent
+# 서버가 시작될 때까지 기다리는 최대 시간 (초)
+SERVER_START_TIMEOUT = 60.0
+
+
+class ScenarioError(Exception):
+    """동작이 화면에 반영되지 않았을 때 발생 (두 번째 인자는 재실행 시간)"""
+
+
+class ServerError(Exception):
+    """Streamlit 서버를 시작하지 못했을 때 발생"""
+
+
+# --- Streamlit 서버 ---
+
+def _free_port():
+    """사용하지 않는 TCP 포트 번호 가져오기"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class StreamlitServer:
+    """`streamlit run`으로 앱을 실행하고 서버 프로세스의 CPU와 메모리를 읽음"""
+
+    def __init__(self, script):
+        self.script = Path(script)
+        self.port = _free_port()
+        self.process = None
+        self._log = None
+
+    @property
+    def url(self):
+        return f"ws://127.0.0.1:{self.port}/_stcore/stream"
+
+    def start(self):
+        """서버를 시작하고 health 확인에 응답할 때까지 기다림"""
+        self._log = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(
+            [
+                sys.executable, "-m", "streamlit", "run", str(self.script),
+                "--server.address", "127.0.0.1",
+                "--server.port", str(self.port),
+                "--server.headless", "true",
+                "--server.fileWatcherType", "none",
+                "--browser.gatherUsageStats", "false",
+                # 사용 중단 경고 같은 로그가 결과 출력에 섞이지 않도록 오류만 기록
+                "--logger.level", "error",
+            ],
+            cwd=self.script.parent,
+            stdout=self._log,
+            stderr=subprocess.STDOUT,
+        )
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                message = f"Streamlit 서버가 종료되었습니다.\n{self.log_tail()}"
+                self.stop()
+                raise ServerError(message)
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/_stcore/health", timeout=1):
+                    return
+            except OSError:
+                time.sleep(0.2)
+        message = f"Streamlit 서버가 {SERVER_START_TIMEOUT:.0f}초 안에 시작되지 않았습니다.\n{self.log_tail()}"
+        self.stop()
+        raise ServerError(message)
+
+    def stop(self):
+        """서버 종료"""
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def log_tail(self, lines=20):
+        """서버 로그의 마지막 몇 줄"""
+        if self._log is None:
+            return ""
+        self._log.seek(0)
+        return "\n".join(self._log.read().decode("utf-8", "replace").splitlines()[-lines:])
+
+    def cpu_seconds(self):
+        """서버 프로세스가 사용한 CPU 시간 (측정할 수 없으면 None)"""
+        try:
+            with open(f"/proc/{self.process.pid}/stat") as f:
+                # 프로세스 이름에 공백이 있을 수 있으므로 ')' 뒤부터 나눔 (utime, stime은 14, 15번째 값)
+                fields = f.read().rsplit(")", 1)[1].split()
+            return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+        except (OSError, ValueError, IndexError, AttributeError):
+            return None
+
+    def rss_mb(self):
+        """서버 프로세스의 현재 메모리 사용량(MB) (측정할 수 없으면 None)"""
+        try:
+            with open(f"/proc/{self.process.pid}/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+        except (OSError, ValueError, IndexError, AttributeError):
+            return None
+
+
+# --- 웹소켓 세션 ---
+
+def _widget_key(widget_id):
+    """위젯 id에서 사용자가 지정한 key 꺼내기 (key가 없으면 None)"""
+    if widget_id.startswith("$$ID-"):
+        key = widget_id.split("-", 2)[2]
+        return None if key == "None" else key
+    return None
+
+
+class Session:
+    """브라우저처럼 위젯 상태를 보내고 재실행 결과(화면 요소)를 받는 웹소켓 세션"""
+
+    def __init__(self, url, timeout):
+        self.url = url
+        self.timeout = timeout
+        self.elements = {}
+        self.status = None
+        self._ws = None
+        self._states = {}
+        self._triggers = []
+
+    async def connect(self):
+        self._ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+
+    async def close(self):
+        if self._ws is not None:
+            await self._ws.close()
+
+    def widgets(self, kind, key=None):
+        """화면에 있는 위젯 중 종류가 kind인 것들의 (id, proto) 목록 (화면 순서)"""
+        found = []
+        for path in sorted(self.elements):
+            element = self.elements[path]
+            if element.WhichOneof("type") == kind:
+                proto = getattr(element, kind)
+                if key is None or _widget_key(proto.id) == key:
+                    found.append((proto.id, proto))
+        return found
+
+    def selected(self, widget_id, proto):
+        """선택 상자의 현재 값 (바꾼 적이 없으면 기본값)"""
+        state = self._states.get(widget_id)
+        return state.string_value if state else proto.options[proto.default]
+
+    def texts(self):
+        """화면에 표시된 markdown 글자 목록"""
+        return [element.markdown.body for element in self.elements.values() if element.WhichOneof("type") == "markdown"]
+
+    def fingerprint(self):
+        """화면 내용 전체의 해시 (동작 뒤에 화면이 바뀌었는지 비교용)"""
+        digest = hashlib.sha1()
+        for path in sorted(self.elements):
+            digest.update(self.elements[path].SerializeToString())
+        return digest.hexdigest()
+
+    def set_value(self, widget_id, value):
+        """선택 상자나 입력 칸 값 바꾸기 (다음 재실행 때 전송)"""
+        self._states[widget_id] = WidgetState(id=widget_id, string_value=value)
+
+    def click(self, widget_id):
+        """버튼 클릭 (다음 재실행 한 번에만 전송)"""
+        self._triggers.append(WidgetState(id=widget_id, trigger_value=True))
+
+    async def rerun(self):
+        """위젯 상태를 보내 스크립트를 재실행하고 끝날 때까지 기다림 (걸린 시간 반환)"""
+        msg = BackMsg()
+        msg.rerun_script.widget_states.widgets.extend(list(self._states.values()) + self._triggers)
+        self._triggers = []
+        started = time.perf_counter()
+        await self._ws.send(msg.SerializeToString())
+
+        elements = {}
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await asyncio.wait_for(self._ws.recv(), self.timeout))
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                elements[tuple(fwd.metadata.delta_path)] = fwd.delta.new_element
+            elif kind == "script_finished" and fwd.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                break
+        latency = time.perf_counter() - started
+
+        self.elements = elements
+        self.status = fwd.script_finished
+        self._sync_states()
+        return latency
+
+    def _sync_states(self):
+        """브라우저처럼 화면에서 사라진 위젯 상태는 버리고, 앱이 바꾼 값은 반영"""
+        present = set()
+        for element in self.elements.values():
+            kind = element.WhichOneof("type")
+            proto = getattr(element, kind)
+            widget_id = getattr(proto, "id", "")
+            if not widget_id:
+                continue
+            present.add(widget_id)
+            # 앱이 session_state로 값을 바꾸면(예: 입력 칸 비우기) 서버가 set_value로 알려 줌
+            if kind == "text_input" and proto.set_value:
+                self.set_value(widget_id, proto.value)
+            elif kind == "selectbox" and proto.set_value:
+                self.set_value(widget_id, proto.raw_value)
+        self._states = {widget_id: state for widget_id, state in self._states.items() if widget_id in present}
+
+
+# --- 세션 시나리오 ---
+# 시나리오는 (Session, random.Random)을 받아 사용자 동작 하나를 실행하고 재실행 시간을 반환합니다.
+# 재실행 뒤에는 동작이 화면에 반영되었는지 확인하고, 반영되지 않았으면 재실행 시간을 담은
+# ScenarioError를 발생시킵니다.
+
+def _check_page(session, latency):
+    """스크립트 예외나 앱의 오류 메시지가 없는지 확인"""
+    if session.status == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+        raise ScenarioError("스크립트를 컴파일하지 못했습니다.", latency)
+    for element in session.elements.values():
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            raise ScenarioError(f"스크립트 예외: {element.exception.message}", latency)
+        if kind == "alert" and element.alert.format == Alert.ERROR:
+            raise ScenarioError(f"앱 오류 메시지: {element.alert.body}", latency)
+
+
+async def motorsports_action(session, rng):
+    """모터스포츠를 고르거나 통계 시즌을 바꾸는 동작"""
+    seasons = session.widgets("selectbox", key="analytics_season")
+    if seasons and len(seasons[0][1].options) > 1 and rng.random() < 0.3:
+        (widget_id, proto), label = seasons[0], "시즌"
+    else:
+        (widget_id, proto), label = session.widgets("selectbox")[0], "모터스포츠"
+    before = session.fingerprint()
+    current = session.selected(widget_id, proto)
+    choice = rng.choice(proto.options)
+
+    session.set_value(widget_id, choice)
+    latency = await session.rerun()
+    _check_page(session, latency)
+    # 다른 항목을 골랐다면 표시되는 내용도 달라져야 함
+    if choice != current and session.fingerprint() == before:
+        raise ScenarioError(f"선택한 {label}이(가) 화면에 반영되지 않았습니다.", latency)
+    return latency
+
+
+def _todo_delete_buttons(session):
+    return [widget_id for widget_id, _ in session.widgets("button") if str(_widget_key(widget_id)).startswith("delete_")]
+
+
+async def todo_action(session, rng):
+    """할 일을 추가하거나 삭제하는 동작"""
+    delete_buttons = _todo_delete_buttons(session)
+    if delete_buttons and rng.random() < 0.4:
+        session.click(rng.choice(delete_buttons))
+        latency = await session.rerun()
+        _check_page(session, latency)
+        if len(_todo_delete_buttons(session)) != len(delete_buttons) - 1:
+            raise ScenarioError("삭제한 할 일이 목록에서 사라지지 않았습니다.", latency)
+        return latency
+
+    todo = f"할 일 {rng.randrange(1_000_000)}"
+    session.set_value(session.widgets("text_input", key="new_todo")[0][0], todo)
+    latency = await session.rerun()
+    _check_page(session, latency)
+    if not any(todo in text for text in session.texts()):
+        raise ScenarioError("추가한 할 일이 목록에 표시되지 않았습니다.", latency)
+    if len(_todo_delete_buttons(session)) != len(delete_buttons) + 1:
+        raise ScenarioError("할 일을 추가했지만 삭제 버튼이 늘어나지 않았습니다.", latency)
+    return latency
+
+
+APPS = {
+    "motorsports": (ROOT / "20702강태양" / "app.py", motorsports_action),
+    "todo": (ROOT / "TODOLIST" / "app.py", todo_action),
+}
+
+
+def _percentile(sorted_values, p):
+    """정렬된 값에서 백분위수 구하기"""
+    index = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run_session(session, action, actions, seed):
+    """세션 하나에서 첫 화면을 불러온 뒤 동작을 실행하고 측정 결과를 dict로 반환"""
+    rng = random.Random(seed)
+    result = {"latencies": [], "check_failures": Counter(), "errors": Counter()}
+
+    try:
+        latency = await session.rerun()
+        result["latencies"].append(latency)
+        _check_page(session, latency)
+    except ScenarioError as e:
+        result["check_failures"][e.args[0]] += 1
+    except Exception as e:
+        result["errors"][f"첫 실행 실패: {type(e).__name__}: {e}"] += 1
+        return result
+
+    for _ in range(actions):
+        try:
+            result["latencies"].append(await action(session, rng))
+        except ScenarioError as e:
+            # 재실행은 되었으므로 지연 시간은 기록하고, 확인 실패만 따로 셈
+            message, latency = e.args
+            result["latencies"].append(latency)
+            result["check_failures"][message] += 1
+        except Exception as e:
+            # 연결이 끊기거나 시간이 초과되면 응답 순서를 알 수 없으므로 세션을 멈춤
+            result["errors"][f"{type(e).__name__}: {e}"] += 1
+            break
+    return result
+
+
+async def _run_level(server, action, sessions, actions, seed, timeout):
+    """서버 하나에 세션들을 동시에 연결해 실행하고 측정 결과를 모음"""
+    # import와 데이터 캐시가 측정에 포함되지 않도록 세션 하나로 먼저 실행
+    warmup = Session(server.url, timeout)
+    await warmup.connect()
+    try:
+        await warmup.rerun()
+    finally:
+        await warmup.close()
+    rss_before = server.rss_mb()
+
+    clients = [Session(server.url, timeout) for _ in range(sessions)]
+    connected = await asyncio.gather(*(client.connect() for client in clients), return_exceptions=True)
+    errors = Counter(f"연결 실패: {type(e).__name__}: {e}" for e in connected if isinstance(e, Exception))
+    clients = [client for client, outcome in zip(clients, connected) if not isinstance(outcome, Exception)]
+
+    try:
+        cpu_before = server.cpu_seconds()
+        started = time.perf_counter()
+        outcomes = await asyncio.gather(
+            *(run_session(client, action, actions, seed + i) for i, client in enumerate(clients))
+        )
+        window = time.perf_counter() - started
+        cpu_after = server.cpu_seconds()
+        # 세션들이 아직 연결되어 있을 때 서버 메모리 측정
+        rss_after = server.rss_mb()
+    finally:
+        await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+
+    for outcome in outcomes:
+        errors.update(outcome["errors"])
+    cpu = cpu_after - cpu_before if cpu_before is not None and cpu_after is not None else None
+    memory = rss_after - rss_before if rss_before is not None and rss_after is not None else None
+    return outcomes, errors, window, cpu, memory, rss_after
+
+
+def run_level(app, sessions, actions, seed, timeout):
+    """동시 세션 수 하나에 대해 새 서버로 부하 테스트를 실행하고 결과 반환"""
+    script, action = APPS[app]
+    server = StreamlitServer(script)
+    server.start()
+    try:
+        outcomes, errors, window, cpu, memory, rss = asyncio.run(
+            _run_level(server, action, sessions, actions, seed, timeout)
+        )
+    finally:
+        server.stop()
+
+    latencies = sorted(latency for outcome in outcomes for latency in outcome["latencies"])
+    check_failures = Counter()
+    for outcome in outcomes:
+        check_failures.update(outcome["check_failures"])
+
+    level = {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "errors": sum(errors.values()),
+        "error_messages": dict(errors.most_common(5)),
+        "check_failures": sum(check_failures.values()),
+        "check_failure_messages": dict(check_failures.most_common(5)),
+        "reruns_per_second": len(latencies) / window if window > 0 else 0.0,
+        "window_seconds": window,
+        "mean_ms": None,
+        "p50_ms": None,
+        "p95_ms": None,
+        "p99_ms": None,
+        "server_rss_mb": rss,
+        # 세션들이 연결된 동안 늘어난 서버 메모리를 세션 수로 나눈 값
+        "memory_per_session_mb": max(memory, 0.0) / sessions if memory is not None else None,
+        # 1.0이면 서버가 CPU 코어 하나를 모두 사용한 것
+        "cpu_cores": cpu / window if cpu is not None and window > 0 else None,
+    }
+    if latencies:
+        level.update({
+            "mean_ms": statistics.mean(latencies) * 1000,
+            "p50_ms": _percentile(latencies, 50) * 1000,
+            "p95_ms": _percentile(latencies, 95) * 1000,
+            "p99_ms": _percentile(latencies, 99) * 1000,
+        })
+    return level
+
+
+def _fmt(value, spec):
+    return format(value, spec) if value is not None else "-"
+
+
+def print_report(app, levels, max_p95):
+    """단계별 결과와 수용 가능한 세션 수 출력"""
+    print(f"\n[{app}] 재실행 지연 시간 보고서 (streamlit run 서버 1개, CPU 코어 {os.cpu_count()}개)")
+    print(f"{'세션':>6} {'재실행':>8} {'오류':>6} {'확인실패':>8} {'rerun/s':>9} {'p50(ms)':>9} {'p95(ms)':>9} "
+          f"{'p99(ms)':>9} {'MB/세션':>9} {'서버MB':>8} {'CPU':>6}")
+    for level in levels:
+        print(
+            f"{level['sessions']:>6} {level['reruns']:>8} {level['errors']:>6} {level['check_failures']:>8} "
+            f"{level['reruns_per_second']:>9.1f} {_fmt(level['p50_ms'], '>9.1f')} "
+            f"{_fmt(level['p95_ms'], '>9.1f')} {_fmt(level['p99_ms'], '>9.1f')} "
+            f"{_fmt(level['memory_per_session_mb'], '>9.2f')} {_fmt(level['server_rss_mb'], '>8.1f')} "
+            f"{_fmt(level['cpu_cores'], '>6.2f')}"
+        )
+
+    for title, field in (("오류", "error_messages"), ("시나리오 확인 실패", "check_failure_messages")):
+        messages = Counter()
+        for level in levels:
+            messages.update(level[field])
+        if messages:
+            print(f"{title}:")
+            for message, count in messages.most_common(5):
+                print(f"  - {message} ({count}회)")
+
+    capacity = capacity_of(levels, max_p95)
+    if capacity:
+        print(f"p95 {max_p95:.0f}ms 이하를 유지하는 최대 동시 세션 수: {capacity}")
+    else:
+        print(f"오류 없이 p95 {max_p95:.0f}ms 이하를 유지한 단계가 없습니다.")
+    return capacity
+
+
+def capacity_of(levels, max_p95):
+    """오류 없이 p95 기준을 지킨 가장 큰 동시 세션 수 (없으면 0)
+
+    시나리오 확인 실패는 재실행 자체는 된 것이므로 따로 보고만 하고 여기서는 보지 않습니다.
+    """
+    passed = [
+        level["sessions"] for level in levels
+        if not level["errors"] and level["p95_ms"] is not None and level["p95_ms"] <= max_p95
+    ]
+    return max(passed, default=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streamlit 대시보드 동시 세션 부하 테스트")
+    parser.add_argument("--app", nargs="+", choices=sorted(APPS), default=sorted(APPS), help="테스트할 앱")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 20], help="동시 세션 수 (단계별)")
+    parser.add_argument("--actions", type=int, default=20, help="세션마다 실행할 동작 수")
+    parser.add_argument("--seed", type=int, default=0, help="동작 선택에 사용할 시드")
+    parser.add_argument("--timeout", type=float, default=30.0, help="재실행 한 번의 최대 시간 (초)")
+    parser.add_argument("--max-p95", type=float, default=500.0, help="수용 가능한 p95 지연 시간 (ms)")
+    parser.add_argument("--min-capacity", type=int, default=0,
+                        help="수용 가능한 세션 수가 이 값보다 작으면 실패 코드로 종료 (성능 저하 확인용)")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+    if any(sessions < 1 for sessions in args.sessions):
+        parser.error("--sessions는 1 이상이어야 합니다.")
+
+    report = {}
+    failed = False
+    for app in args.app:
+        levels = []
+        for sessions in sorted(args.sessions):
+            print(f"[{app}] 동시 세션 {sessions}개 실행 중...", flush=True)
+            try:
+                levels.append(run_level(app, sessions, args.actions, args.seed, args.timeout))
+            except ServerError as e:
+                sys.exit(f"[{app}] {e}")
+        capacity = print_report(app, levels, args.max_p95)
+        report[app] = {
+            "mode": "streamlit run 서버",
+            "cpu_count": os.cpu_count(),
+            "max_p95_ms": args.max_p95,
+            "capacity": capacity,
+            "levels": levels,
+        }
+        failed = failed or capacity < args.min_capacity
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과를 {args.json}에 저장했습니다.")
+
+    if failed:
+        print(f"\n수용 가능한 세션 수가 기준({args.min_capacity})보다 작습니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
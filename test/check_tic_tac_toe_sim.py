@@ -0,0 +1,77 @@
+# tic_tac_toe_sim.py의 벡터화된 승리 판정 검증 스크립트
+# 처음부터 둘 수 있는 모든 보드를 만들어서 check_winners와 completing_cells가
+# tic_tac_toe.check_winner와 같은 결과를 내는지 확인합니다.
+#
+# 실행 방법:
+#     python check_tic_tac_toe_sim.py
+import sys
+
+import numpy as np
+
+from tic_tac_toe import check_winner
+from tic_tac_toe_sim import EMPTY, O, X, check_winners, completing_cells
+
+SYMBOLS = {EMPTY: " ", X: "X", O: "O"}
+
+
+# 보드 배열(9칸)을 tic_tac_toe.py에서 쓰는 3x3 리스트 보드로 바꾸는 함수
+def to_list_board(flat):
+    return [[SYMBOLS[flat[3 * i + j]] for j in range(3)] for i in range(3)]
+
+
+# 빈 보드에서 시작해 승부가 날 때까지 둘 수 있는 모든 보드를 모으는 함수
+def reachable_boards():
+    boards = set()
+    stack = [((EMPTY,) * 9, X)]
+    while stack:
+        board, player = stack.pop()
+        if board in boards:
+            continue
+        boards.add(board)
+        listed = to_list_board(board)
+        if check_winner(listed, "X") or check_winner(listed, "O"):
+            continue  # 승부가 난 보드에서는 더 두지 않음
+        for cell in range(9):
+            if board[cell] == EMPTY:
+                stack.append((board[:cell] + (player,) + board[cell + 1:], -player))
+    return np.array(sorted(boards), dtype=np.int8)
+
+
+def main():
+    boards = reachable_boards()
+    failed = 0
+    for player in (X, O):
+        symbol = SYMBOLS[player]
+        winners = check_winners(boards, player)
+        cells = completing_cells(boards, player)
+        for n, flat in enumerate(boards.tolist()):
+            listed = to_list_board(flat)
+            if winners[n] != check_winner(listed, symbol):
+                failed += 1
+                print(f"check_winners 불일치 ({symbol}): {flat}")
+
+            # 빈 칸에 두었을 때 승리하는 칸이 completing_cells와 같은지 확인
+            # (이미 승부가 난 보드에서는 두 줄 완성 여부만 비교하므로 제외)
+            if check_winner(listed, "X") or check_winner(listed, "O"):
+                continue
+            for cell in range(9):
+                if flat[cell] != EMPTY:
+                    expected = False
+                else:
+                    row, col = divmod(cell, 3)
+                    listed[row][col] = symbol
+                    expected = check_winner(listed, symbol)
+                    listed[row][col] = " "
+                if cells[n, cell] != expected:
+                    failed += 1
+                    print(f"completing_cells 불일치 ({symbol}, 칸 {cell}): {flat}")
+
+    print(f"검사한 보드 수: {len(boards):,}")
+    if failed:
+        print(f"{failed}개 불일치가 있습니다.")
+        sys.exit(1)
+    print("벡터화된 승리 판정이 tic_tac_toe.check_winner와 같습니다.")
+
+
+if __name__ == "__main__":
+    main()
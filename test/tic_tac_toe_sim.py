@@ -0,0 +1,221 @@
+# 틱택토 AI 전략을 통계적으로 비교하기 위한 헤드리스 시뮬레이터
+# 여러 판의 보드를 NumPy 배열로 한꺼번에 진행하고, 대회는 프로세스 풀에 나눠서 실행합니다.
+#
+# tic_tac_toe.py와 달리 NumPy가 필요합니다:
+#     pip install -r requirements.txt
+#
+# 승리 판정을 수정했다면 check_tic_tac_toe_sim.py로 tic_tac_toe.check_winner와 같은지 확인하세요.
+#
+# 사용 예시:
+#     python tic_tac_toe_sim.py --games 1000000 --workers 4 --seed 42
+import argparse
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from tic_tac_toe import get_computer_move
+
+# 보드 칸의 값: 빈 칸은 0, X는 1, O는 -1
+EMPTY = 0
+X = 1
+O = -1
+
+# 승리 조건이 되는 8개의 줄 (칸 번호 0-8)
+LINES = np.array([
+    [0, 1, 2], [3, 4, 5], [6, 7, 8],  # 행
+    [0, 3, 6], [1, 4, 7], [2, 5, 8],  # 열
+    [0, 4, 8], [2, 4, 6],             # 대각선
+])
+
+# 각 칸의 우선순위 (가운데 > 모서리 > 변)
+CELL_PRIORITY = np.array([2, 1, 2, 1, 3, 1, 2, 1, 2], dtype=np.float64)
+
+
+# 빈 칸인지 나타내는 (N, 9) 불리언 마스크를 반환하는 함수
+def legal_moves(boards):
+    return boards == EMPTY
+
+
+# 각 보드에서 player가 승리했는지 나타내는 (N,) 불리언 배열을 반환하는 함수
+def check_winners(boards, player):
+    # (N, 8, 3) 배열로 모든 줄을 한 번에 가져와서 세 칸이 모두 player인지 확인
+    return (boards[:, LINES] == player).all(axis=2).any(axis=1)
+
+
+# player가 다음 수에 줄을 완성할 수 있는 칸을 나타내는 (N, 9) 마스크를 반환하는 함수
+def completing_cells(boards, player):
+    lines = boards[:, LINES]  # (N, 8, 3)
+    # 같은 돌 두 개와 빈 칸 하나로 이루어진 줄만 골라냄
+    ready = ((lines == player).sum(axis=2) == 2) & ((lines == EMPTY).sum(axis=2) == 1)
+    cells = np.zeros(boards.shape, dtype=bool)
+    for k in range(len(LINES)):
+        # 준비된 줄의 빈 칸을 표시
+        cells[:, LINES[k]] |= ready[:, k, None] & (lines[:, k] == EMPTY)
+    return cells
+
+
+# 점수가 가장 높은 합법적인 칸을 고르는 함수 (동점은 난수로 결정)
+def _pick(scores, legal, rng):
+    scores = scores + rng.random(scores.shape)
+    scores[~legal] = -np.inf
+    return scores.argmax(axis=1)
+
+
+# --- 벡터화된 전략 ---
+# 전략은 (boards, player, rng)를 받아 각 보드에서 둘 칸 번호 (N,)를 반환합니다.
+
+# 빈 칸 중 하나를 랜덤으로 선택하는 전략 (get_computer_move와 같은 동작)
+def random_strategy(boards, player, rng):
+    legal = legal_moves(boards)
+    return _pick(np.zeros(boards.shape), legal, rng)
+
+
+# 이길 수 있으면 이기고, 막아야 하면 막고, 아니면 좋은 칸을 고르는 전략
+def greedy_strategy(boards, player, rng):
+    legal = legal_moves(boards)
+    scores = np.broadcast_to(CELL_PRIORITY, boards.shape).copy()
+    scores += completing_cells(boards, -player) * 10  # 상대의 승리 막기
+    scores += completing_cells(boards, player) * 100  # 내 승리 완성하기
+    return _pick(scores, legal, rng)
+
+
+# 기존의 리스트 보드용 함수(get_computer_move 등)를 전략으로 감싸는 함수
+# 보드마다 파이썬 함수를 호출하므로 벡터화된 전략보다 훨씬 느립니다.
+def scalar_strategy(move_func):
+    symbols = {EMPTY: " ", X: "X", O: "O"}
+
+    def strategy(boards, player, rng):
+        moves = np.empty(len(boards), dtype=np.int64)
+        for n, flat in enumerate(boards.tolist()):
+            board = [[symbols[flat[3 * i + j]] for j in range(3)] for i in range(3)]
+            row, col = move_func(board)
+            moves[n] = row * 3 + col
+        return moves
+
+    return strategy
+
+
+# 대회에서 사용할 수 있는 전략 목록 (워커 프로세스에는 이름으로 전달)
+STRATEGIES = {
+    "random": random_strategy,
+    "greedy": greedy_strategy,
+    "computer": scalar_strategy(get_computer_move),
+}
+
+
+# n_games판을 동시에 진행하고 각 판의 결과를 반환하는 함수
+# 결과 값: 1이면 X 승리, -1이면 O 승리, 0이면 무승부
+def play_batch(n_games, strategy_x, strategy_o, rng):
+    boards = np.zeros((n_games, 9), dtype=np.int8)
+    outcomes = np.zeros(n_games, dtype=np.int8)
+    active = np.ones(n_games, dtype=bool)  # 아직 끝나지 않은 판
+
+    player = X
+    for _ in range(9):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        strategy = strategy_x if player == X else strategy_o
+        current = boards[idx]
+        moves = strategy(current, player, rng)
+
+        # 전략이 이미 채워진 칸을 고르면 잘못된 전략이므로 바로 알림
+        if not legal_moves(current)[np.arange(idx.size), moves].all():
+            raise ValueError("전략이 이미 선택된 칸을 골랐습니다.")
+
+        boards[idx, moves] = player
+        won = check_winners(boards[idx], player)
+        outcomes[idx[won]] = player
+        active[idx[won]] = False
+
+        # 다음 플레이어로 전환
+        player = -player
+
+    # 9수가 모두 끝날 때까지 승자가 없으면 무승부 (outcomes는 0 그대로)
+    return outcomes
+
+
+# 워커 프로세스에서 한 묶음의 게임을 실행하고 [X 승, 무승부, O 승] 횟수를 반환하는 함수
+def _run_chunk(task):
+    name_x, name_o, n_games, seed_seq = task
+    rng = np.random.default_rng(seed_seq)
+    # get_computer_move처럼 random 모듈을 쓰는 전략도 재현 가능하도록 같은 시드로 초기화
+    random.seed(int(seed_seq.generate_state(1)[0]))
+    outcomes = play_batch(n_games, STRATEGIES[name_x], STRATEGIES[name_o], rng)
+    return name_x, name_o, [
+        int((outcomes == X).sum()),
+        int((outcomes == EMPTY).sum()),
+        int((outcomes == O).sum()),
+    ]
+
+
+# 모든 전략 쌍(X, O)에 대해 n_games판씩 대결시키는 함수
+# 게임은 batch_size판씩 묶음으로 나누고, 각 묶음은 SeedSequence에서 파생된 시드를 받습니다.
+# 따라서 같은 seed를 주면 워커 수와 상관없이 항상 같은 결과가 나옵니다.
+def run_tournament(names, n_games, workers=None, seed=None, batch_size=100_000):
+    tasks = []
+    for name_x in names:
+        for name_o in names:
+            for start in range(0, n_games, batch_size):
+                tasks.append((name_x, name_o, min(batch_size, n_games - start)))
+
+    seeds = np.random.SeedSequence(seed).spawn(len(tasks))
+    tasks = [task + (seed_seq,) for task, seed_seq in zip(tasks, seeds)]
+
+    table = {(name_x, name_o): [0, 0, 0] for name_x in names for name_o in names}
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for name_x, name_o, counts in executor.map(_run_chunk, tasks):
+            for i, count in enumerate(counts):
+                table[(name_x, name_o)][i] += count
+    elapsed = time.perf_counter() - started
+
+    total_games = n_games * len(names) ** 2
+    return table, total_games / elapsed if elapsed > 0 else float("inf")
+
+
+# 대회 결과를 승/무/패 표로 출력하는 함수 (행: X 전략, 열: O 전략, X 기준 승률)
+def print_table(table, names, games_per_second):
+    width = max(len(name) for name in names + ["X \\ O"]) + 2
+    cell = 20
+    print("X \\ O".ljust(width) + "".join(name.rjust(cell) for name in names))
+    for name_x in names:
+        row = name_x.ljust(width)
+        for name_o in names:
+            wins, draws, losses = table[(name_x, name_o)]
+            total = wins + draws + losses
+            row += f"{wins / total:6.1%}/{draws / total:5.1%}/{losses / total:5.1%}".rjust(cell)
+        print(row)
+    print("(승/무/패, X 기준)")
+    print(f"처리량: {games_per_second:,.0f} games/s")
+
+
+# 스크립트의 진입점
+def main():
+    parser = argparse.ArgumentParser(description="틱택토 AI 전략 대회 시뮬레이터")
+    parser.add_argument("--games", type=int, default=100_000, help="전략 쌍마다 진행할 게임 수")
+    parser.add_argument("--strategies", nargs="+", default=["random", "greedy"],
+                        choices=sorted(STRATEGIES), help="대회에 참가할 전략")
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--seed", type=int, default=None, help="재현 가능한 결과를 위한 시드")
+    parser.add_argument("--batch-size", type=int, default=100_000, help="한 번에 진행할 보드 수")
+    args = parser.parse_args()
+    if args.games < 1:
+        parser.error("--games는 1 이상이어야 합니다.")
+    if args.batch_size < 1:
+        parser.error("--batch-size는 1 이상이어야 합니다.")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers는 1 이상이어야 합니다.")
+    if len(set(args.strategies)) != len(args.strategies):
+        parser.error("--strategies에 같은 전략을 두 번 넣을 수 없습니다.")
+
+    table, games_per_second = run_tournament(
+        args.strategies, args.games, workers=args.workers, seed=args.seed, batch_size=args.batch_size
+    )
+    print_table(table, args.strategies, games_per_second)
+
+
+if __name__ == "__main__":
+    main()